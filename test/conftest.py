@@ -0,0 +1,89 @@
+"""
+Shared pytest fixtures.
+
+Serial port resolution and VedirectController construction
+(which opens the serial port and runs serial tests) are done once per session.
+"""
+from types import MappingProxyType
+import pytest
+from vedirect_m8.serconnect import SerialConnection
+from vedirect_m8.ve_controller import VedirectController
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2020, Eli Serra"
+__deprecated__ = False
+__license__ = "MIT"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+# serial tests identifying the simulated device, shared by all tests.
+_SERIAL_TEST = MappingProxyType({
+    'PID_test': MappingProxyType({
+        "typeTest": "value",
+        "key": "PID",
+        "value": "0x203"
+    })
+})
+
+
+def _get_serial_test() -> dict:
+    """Return a mutable copy of the serial tests identifying the simulated device."""
+    return {key: dict(value) for key, value in _SERIAL_TEST.items()}
+
+
+@pytest.fixture(scope="session")
+def serial_port_path():
+    """Return the virtual serial port path used by tests."""
+    return SerialConnection.get_virtual_home_serial_port("vmodem1")
+
+
+@pytest.fixture
+def serial_connection(serial_port_path):
+    """Return a new SerialConnection instance (serial port not opened)."""
+    return SerialConnection(serial_port=serial_port_path,
+                            baud=19200,
+                            timeout=0)
+
+
+@pytest.fixture
+def serial_test():
+    """Return the serial tests identifying the simulated device."""
+    return _get_serial_test()
+
+
+@pytest.fixture(scope="session")
+def ve_controller(serial_port_path):
+    """Return a VedirectController instance shared by the whole session."""
+    controller = VedirectController(
+        serial_port=serial_port_path,
+        baud=19200,
+        timeout=0,
+        serial_test=_get_serial_test()
+    )
+    yield controller
+    if controller.is_serial_ready():
+        controller._com.ser.close()
+
+
+@pytest.fixture
+def ve(ve_controller):
+    """Return the shared VedirectController with reader properties initialised."""
+    ve_controller.init_data_read()
+    return ve_controller
+
+
+@pytest.fixture
+def ve_isolated(ve_controller):
+    """
+    Return the shared VedirectController for tests altering his settings.
+
+    The serial connection and serial tests are restored on teardown.
+    """
+    com, ser_test = ve_controller._com, ve_controller._ser_test
+    ve_controller.init_data_read()
+    yield ve_controller
+    if ve_controller._com is not com and ve_controller.is_serial_ready():
+        ve_controller._com.ser.close()
+    ve_controller._com, ve_controller._ser_test = com, ser_test
+    ve_controller.connect_to_serial()
+    ve_controller.init_data_read()
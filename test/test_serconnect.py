@@ -4,6 +4,7 @@ SerialConnection unittest class.
 Use pytest package.
 """
 import os
+import pytest
 from vedirect_m8.serconnect import SerialConnection
 from vedirect_m8.serutils import SerialUtils as Ut
 
@@ -15,39 +16,33 @@ __status__ = "Production"
 __version__ = "1.0.0"
 
 
-class TestSerialConnection:
-
-    def setup_method(self):
-        """
-        Setup any state tied to the execution of the given function.
+# noinspection PyTypeChecker
+@pytest.fixture(scope="module")
+def v_ports():
+    """Return virtual home serial ports from valid and invalid port names."""
+    names = ["vmodem999", "vmodem0", "vmodem", "vmodem9999", "z9999", 1, dict()]
+    return [SerialConnection.get_virtual_home_serial_port(name) for name in names]
 
-        Invoked for every test function in the module.
-        """
-        conf = {
-            'serial_port': SerialConnection.get_virtual_home_serial_port("vmodem1"),
-            'baud': 19200,
-            'timeout': 0,
-        }
 
-        self.obj = SerialConnection(**conf)
+class TestSerialConnection:
 
-    def test_settings(self):
+    def test_settings(self, serial_connection):
         """Test configuration settings from SerialConnection constructor."""
-        assert self.obj.is_settings()
+        assert serial_connection.is_settings()
 
-    def test_set_timeout(self):
+    def test_set_timeout(self, serial_connection):
         """Test set_timeout method."""
-        assert self.obj.set_timeout(0)
-        assert self.obj.set_timeout(10)
-        assert not self.obj.set_timeout(-1)
-        assert not self.obj.set_timeout("hello")
+        assert serial_connection.set_timeout(0)
+        assert serial_connection.set_timeout(10)
+        assert not serial_connection.set_timeout(-1)
+        assert not serial_connection.set_timeout("hello")
 
-    def test_set_source_name(self):
+    def test_set_source_name(self, serial_connection):
         """Test set_source_name method."""
-        assert self.obj.set_source_name("hello")
-        assert not self.obj.set_source_name("")
-        assert not self.obj.set_source_name(-1)
-        assert not self.obj.set_source_name(None)
+        assert serial_connection.set_source_name("hello")
+        assert not serial_connection.set_source_name("")
+        assert not serial_connection.set_source_name(-1)
+        assert not serial_connection.set_source_name(None)
 
     @staticmethod
     def test_get_virtual_ports_paths():
@@ -56,50 +51,29 @@ class TestSerialConnection:
         assert Ut.is_list(paths) and len(paths) == 1
         assert paths[0] == os.path.expanduser('~')
 
-    # noinspection PyTypeChecker
     @staticmethod
-    def test_get_virtual_home_serial_port():
+    def test_get_virtual_home_serial_port(v_ports):
         """Test get_virtual_home_serial_port method."""
-        v_ports = [
-            SerialConnection.get_virtual_home_serial_port("vmodem999"),
-            SerialConnection.get_virtual_home_serial_port("vmodem0"),
-            SerialConnection.get_virtual_home_serial_port("vmodem"),
-            SerialConnection.get_virtual_home_serial_port("vmodem9999"),
-            SerialConnection.get_virtual_home_serial_port("z9999"),
-            SerialConnection.get_virtual_home_serial_port(1),
-            SerialConnection.get_virtual_home_serial_port(dict())
-        ]
         tests = [x for x in v_ports if x is not None]
         assert len(tests) == 2
 
-    # noinspection PyTypeChecker
     @staticmethod
-    def test_is_virtual_serial_port():
+    def test_is_virtual_serial_port(v_ports):
         """Test is_virtual_serial_port method."""
-        virtual_ports = [
-            SerialConnection.get_virtual_home_serial_port("vmodem999"),
-            SerialConnection.get_virtual_home_serial_port("vmodem0"),
-            SerialConnection.get_virtual_home_serial_port("vmodem"),
-            SerialConnection.get_virtual_home_serial_port("vmodem9999"),
-            SerialConnection.get_virtual_home_serial_port("z9999"),
-            SerialConnection.get_virtual_home_serial_port(1),
-            SerialConnection.get_virtual_home_serial_port(dict())
-        ]
-        tests = [x for x in virtual_ports if SerialConnection.is_virtual_serial_port(x)]
+        tests = [x for x in v_ports if SerialConnection.is_virtual_serial_port(x)]
         assert len(tests) == 2
 
     @staticmethod
-    def test_split_serial_port():
+    @pytest.mark.parametrize("port, expected", [
+        ("r", True),
+        ("/r", True),
+        ("a/b/c/r", True),
+        ("/r/", False),
+        ("\\r", False),
+    ])
+    def test_split_serial_port(port, expected):
         """Test split_serial_port method."""
-        ports = [
-            "r",
-            "/r",
-            "a/b/c/r",
-            "/r/",
-            "\\r"
-        ]
-        tests = [x for x in ports if SerialConnection.split_serial_port(x)[0] == 'r']
-        assert len(tests) == 3
+        assert (SerialConnection.split_serial_port(port)[0] == 'r') is expected
 
     @staticmethod
     def test_is_serial_port_exists():
@@ -112,67 +86,68 @@ class TestSerialConnection:
         assert len(tests) == 2
 
     @staticmethod
-    def test_is_serial_port():
+    @pytest.mark.parametrize("port, expected", [
+        (SerialConnection.get_virtual_home_serial_port("vmodem0"), True),
+        (SerialConnection.get_virtual_home_serial_port("vmodem1"), True),
+        ("/dev/ttyUSB1", True),
+        ("/dev/ttyACM1", True),
+        ("/dev/vmodem0", True),
+        ("/dev/vmodem1", True),
+        ("/dev/COM1", True),
+        ("COM1", True),
+        ("COM1999", False),
+        ("/dev/USB1", False),
+        ("/dev/ACM1", False),
+        ("/dev/1", False),
+    ])
+    def test_is_serial_port(port, expected):
         """Test is_serial_port method."""
-        ports = [
-            SerialConnection.get_virtual_home_serial_port("vmodem0"),
-            SerialConnection.get_virtual_home_serial_port("vmodem1"),
-            "/dev/ttyUSB1",
-            "/dev/ttyACM1",
-            "/dev/vmodem0",
-            "/dev/vmodem1",
-            "/dev/COM1",
-            "COM1",
-            "COM1999",  # false
-            "/dev/USB1",  # false
-            "/dev/ACM1",  # false
-            "/dev/1",  # false
-        ]
-        tests = [x for x in ports if SerialConnection.is_serial_port(x)]
-        assert len(tests) == 8
+        assert SerialConnection.is_serial_port(port) is expected
 
     @staticmethod
-    def test_is_serial_path():
+    @pytest.mark.parametrize("path, expected", [
+        (os.path.expanduser('~'), True),
+        ("/dev", True),
+        ("/dev/pts/", False),
+        ("/var", False),
+        ("/var/run/", False),
+        (1, False),
+        (1.1, False),
+        (("COM1999", 1), False),
+        (dict(), False),
+        (None, False),
+    ])
+    def test_is_serial_path(path, expected):
         """Test is_serial_path method."""
-        paths = [
-            os.path.expanduser('~'),  # true
-            "/dev",  # true
-            "/dev/pts/",
-            "/var",
-            "/var/run/",
-            1,
-            1.1,
-            ("COM1999", 1),
-            dict(),
-            None
-        ]
-        tests = [x for x in paths if SerialConnection.is_serial_path(x)]
-        assert len(tests) == 2
+        assert SerialConnection.is_serial_path(path) is expected
 
     @staticmethod
-    def test_is_baud():
+    @pytest.mark.parametrize("baud, expected", [
+        *[(baud, True) for baud in (110, 300, 600, 1200,
+                                    2400, 4800, 9600, 14400,
+                                    19200, 38400, 57600, 115200,
+                                    128000, 256000)],
+        *[(baud, False) for baud in (0, 1, 10, 302, 2500, 4900, "300")],
+    ])
+    def test_is_baud(baud, expected):
         """Test is_baud method."""
-        bauds = [
-            110, 300, 600, 1200,
-            2400, 4800, 9600, 14400,
-            19200, 38400, 57600, 115200,
-            128000, 256000, 0, 1, 10, 302,
-            2500, 4900, "300"
-        ]
-        tests = [x for x in bauds if SerialConnection.is_baud(x)]
-        assert len(tests) == 14
+        assert SerialConnection.is_baud(baud) is expected
 
     @staticmethod
-    def test_is_timeout():
+    @pytest.mark.parametrize("timeout, expected", [
+        (1, True),
+        (5, True),
+        (10, True),
+        (0.1, True),
+        (0, True),
+        (None, True),
+        ("2400", False),
+    ])
+    def test_is_timeout(timeout, expected):
         """Test is_timeout method."""
-        timeouts = [
-            1, 5, 10, 0.1, 0, None,
-            "2400"
-        ]
-        tests = [x for x in timeouts if SerialConnection.is_timeout(x)]
-        assert len(tests) == 6
+        assert SerialConnection.is_timeout(timeout) is expected
 
-    def test_set_serial_conf(self):
+    def test_set_serial_conf(self, serial_connection):
         """Test set_serial_conf method."""
         conf = {
             'serial_port': SerialConnection.get_virtual_home_serial_port("vmodem0"),
@@ -181,21 +156,21 @@ class TestSerialConnection:
             'write_timeout': 0,
             'exclusive': True
         }
-        result = self.obj.set_serial_conf(**conf)
+        result = serial_connection.set_serial_conf(**conf)
         assert Ut.is_dict(result, eq=5)
 
-    def test_connect(self):
+    def test_connect(self, serial_connection):
         """Test connect method."""
-        assert self.obj.connect()
-        assert self.obj.is_serial_ready()
-        assert self.obj.is_ready()
+        assert serial_connection.connect()
+        assert serial_connection.is_serial_ready()
+        assert serial_connection.is_ready()
 
-    def test_get_serial_ports_list(self):
+    def test_get_serial_ports_list(self, serial_connection):
         """Test get_serial_ports_list method."""
-        serial_ports = self.obj.get_serial_ports_list()
+        serial_ports = serial_connection.get_serial_ports_list()
         assert Ut.is_list(serial_ports) and len(serial_ports) == 2
 
-    def test_get_unix_virtual_serial_ports_list(self):
+    def test_get_unix_virtual_serial_ports_list(self, serial_connection):
         """Test get_unix_virtual_serial_ports_list method."""
-        serial_ports = self.obj.get_unix_virtual_serial_ports_list()
+        serial_ports = serial_connection.get_unix_virtual_serial_ports_list()
         assert Ut.is_list(serial_ports) and len(serial_ports) == 2
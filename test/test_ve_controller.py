@@ -1,6 +1,7 @@
 """VedirectController unittest class."""
 import time
 import pytest
+import serial
 from vedirect_m8.ve_controller import VedirectController
 from vedirect_m8.serconnect import SerialConnection
 from ve_utils.utype import UType as Ut
@@ -9,38 +10,17 @@ from vedirect_m8.exceptions import SettingInvalidException, InputReadException,
 
 class TestVedirectController:
 
-    def setup_method(self):
-        """
-        Setup any state tied to the execution of the given function.
-
-        Invoked for every test function in the module.
-        """
-        conf = {
-            'serial_port': SerialConnection.get_virtual_home_serial_port("vmodem1"),
-            'baud': 19200,
-            'timeout': 0,
-            "serial_test": {
-                'PID_test': {
-                    "typeTest": "value",
-                    "key": "PID",
-                    "value": "0x203"
-                }
-            }
-        }
-
-        self.obj = VedirectController(**conf)
-
-    def test_settings(self):
+    def test_settings(self, ve):
         """Test configuration settings from Vedirect constructor."""
-        assert self.obj.is_serial_ready()
-        assert self.obj.is_ready()
-        assert self.obj.has_serial_com()
-        assert self.obj.connect_to_serial()
-        assert self.obj.has_serial_test()
+        assert ve.is_serial_ready()
+        assert ve.is_ready()
+        assert ve.has_serial_com()
+        assert ve.connect_to_serial()
+        assert ve.has_serial_test()
 
-    def test_is_serial_com(self):
+    def test_is_serial_com(self, ve):
         """Test is_serial_com method."""
-        assert VedirectController.is_serial_com(self.obj._com)
+        assert VedirectController.is_serial_com(ve._com)
         assert not VedirectController.is_serial_com(dict())
         assert not VedirectController.is_serial_com(None)
 
@@ -52,37 +32,31 @@ class TestVedirectController:
             VedirectController.is_timeout(elapsed=60, timeout=60)
             VedirectController.is_timeout(elapsed=102, timeout=60)
 
-    def test_init_serial_test(self):
+    def test_init_serial_test(self, ve_isolated, serial_test):
         """Test init_serial_test method."""
-        assert self.obj.init_serial_test({
-            'PID_test': {
-                "typeTest": "value",
-                "key": "PID",
-                "value": "0x203"
-            }
-        })
+        assert ve_isolated.init_serial_test(serial_test)
 
         with pytest.raises(SettingInvalidException):
-            self.obj.init_serial_test(serial_test=None)
+            ve_isolated.init_serial_test(serial_test=None)
 
         with pytest.raises(SettingInvalidException):
-            self.obj.init_serial_test(serial_test=list())
+            ve_isolated.init_serial_test(serial_test=list())
 
         with pytest.raises(SettingInvalidException):
-            self.obj.init_serial_test(serial_test=dict())
+            ve_isolated.init_serial_test(serial_test=dict())
 
         with pytest.raises(SettingInvalidException):
-            self.obj.init_serial_test(serial_test={
+            ve_isolated.init_serial_test(serial_test={
                 'PID_test': {
                     "typeTest": "value",
                     "key": "PID"
                 }
             })
 
-    def test_init_serial_connection_from_object(self):
+    def test_init_serial_connection_from_object(self, ve_isolated):
         """Test init_serial_connection_from_object method."""
-        obj = self.obj._com
-        assert self.obj.init_serial_connection_from_object(obj)
+        obj = ve_isolated._com
+        assert ve_isolated.init_serial_connection_from_object(obj)
 
         # test with bad serial port format
         obj = SerialConnection(
@@ -90,7 +64,7 @@ class TestVedirectController:
             source_name="TestVedirect"
         )
         with pytest.raises(SettingInvalidException):
-            self.obj.init_serial_connection_from_object(obj)
+            ve_isolated.init_serial_connection_from_object(obj)
 
         # test with bad serial port connection
         obj = SerialConnection(
@@ -98,36 +72,36 @@ class TestVedirectController:
             source_name="TestVedirect"
         )
         with pytest.raises(VedirectException):
-            self.obj.init_serial_connection_from_object(obj)
+            ve_isolated.init_serial_connection_from_object(obj)
 
-    def test_init_serial_connection(self):
+    def test_init_serial_connection(self, ve_isolated):
         """Test init_serial_connection method."""
-        assert self.obj.init_serial_connection(serial_port=self.obj._com._serial_port,
+        assert ve_isolated.init_serial_connection(serial_port=ve_isolated._com._serial_port,
                                                source_name="TestVedirectController"
                                                )
 
         # test with bad serial port format
         with pytest.raises(SettingInvalidException):
-            self.obj.init_serial_connection(serial_port="/etc/bad_port",
+            ve_isolated.init_serial_connection(serial_port="/etc/bad_port",
                                             source_name="TestVedirectController"
                                             )
 
         # test with bad serial port connection
         with pytest.raises(VedirectException):
-            self.obj.init_serial_connection(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
+            ve_isolated.init_serial_connection(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
                                             source_name="TestVedirectController"
                                             )
 
-    def test_init_settings(self):
+    def test_init_settings(self, ve_isolated):
         """Test init_settings method."""
-        good_serial_port = self.obj._com._serial_port
-        assert self.obj.init_settings(serial_port=good_serial_port,
+        good_serial_port = ve_isolated._com._serial_port
+        assert ve_isolated.init_settings(serial_port=good_serial_port,
                                       source_name="TestVedirectController"
                                       )
 
         # test with bad serial port format
         with pytest.raises(SettingInvalidException):
-            self.obj.init_settings(serial_port="/etc/bad_port",
+            ve_isolated.init_settings(serial_port="/etc/bad_port",
                                    source_name="TestVedirectController"
                                    )
 
@@ -135,87 +109,186 @@ class TestVedirectController:
         # the serial port vmodem255 is not defined
         # the method search a valid serial port with serial test data
         # and return True when reached a valid serial port
-        assert self.obj.init_settings(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
+        assert ve_isolated.init_settings(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
                                       source_name="TestVedirectController",
                                       wait_timeout=30
                                       )
         # now serial port is same as start
-        assert good_serial_port == self.obj._com._serial_port
+        assert good_serial_port == ve_isolated._com._serial_port
 
         with pytest.raises(VedirectException):
-            self.obj._ser_test = None
-            self.obj.init_settings(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
+            ve_isolated._ser_test = None
+            ve_isolated.init_settings(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
                                    source_name="TestVedirectController",
                                    wait_timeout=0.5
                                    )
 
-    def test_read_data_to_test(self):
+    def test_read_data_to_test(self, ve):
         """Test read_data_to_test method."""
-        data = self.obj.read_data_to_test()
+        data = ve.read_data_to_test()
         assert Ut.is_dict(data, not_null=True)
 
-    def test_search_serial_port(self):
+    def test_test_serial_ports(self, ve_isolated, serial_port_path, monkeypatch):
+        """Test test_serial_ports method."""
+        ve_isolated._com = SerialConnection(serial_port=serial_port_path,
+                                            source_name="TestVedirectController"
+                                            )
+        bad_serial_port = SerialConnection.get_virtual_home_serial_port("vmodem0")
+        assert not ve_isolated.test_serial_ports([bad_serial_port])
+        failed_at = ve_isolated._failed_ports.get(bad_serial_port)
+        assert failed_at is not None
+
+        # record probed ports
+        probed, connect = [], ve_isolated._com.connect
+
+        def connect_spy(**kwargs):
+            probed.append(kwargs.get('serial_port'))
+            return connect(**kwargs)
+
+        ve_isolated._com.connect = connect_spy
+
+        # bad_serial_port failed recently and is skipped,
+        # serial_port_path fails too and get his own failure time
+        monkeypatch.setattr(ve_isolated._ser_test, "run_serial_tests", lambda data: False)
+        assert not ve_isolated.test_serial_ports([bad_serial_port, serial_port_path])
+        assert probed == [serial_port_path]
+        assert ve_isolated._failed_ports[bad_serial_port] == failed_at
+        assert ve_isolated._failed_ports[serial_port_path] > failed_at
+
+        # failed ports are cleared if serial_port_path test success
+        probed.clear()
+        del ve_isolated._failed_ports[serial_port_path]
+        monkeypatch.setattr(ve_isolated._ser_test, "run_serial_tests", lambda data: True)
+        assert ve_isolated.test_serial_ports([bad_serial_port, serial_port_path])
+        assert probed == [serial_port_path]
+        assert ve_isolated._failed_ports == {}
+        monkeypatch.undo()
+
+        # all ports failed recently, so they are tested again
+        ve_isolated._failed_ports[bad_serial_port] = failed_at
+        assert not ve_isolated.test_serial_ports([bad_serial_port])
+        assert ve_isolated._failed_ports.get(bad_serial_port) > failed_at
+
+    def test_test_serial_ports_pending(self, ve_isolated, serial_port_path):
+        """Test test_serial_ports does not validate a port with blocks read from previous port."""
+        ve_isolated._com = SerialConnection(serial_port=serial_port_path,
+                                            source_name="TestVedirectController"
+                                            )
+        ve_isolated.connect_to_serial()
+        # leave a block passing serial tests pending
+        for _ in range(10):
+            packet = ve_isolated.read_data_single()
+            if ve_isolated._ser_test.run_serial_tests(packet):
+                break
+        assert ve_isolated._ser_test.run_serial_tests(packet)
+        ve_isolated._pending.append(packet)
+
+        bad_serial_port = SerialConnection.get_virtual_home_serial_port("vmodem0")
+        assert not ve_isolated.test_serial_ports([bad_serial_port])
+        assert len(ve_isolated._pending) == 0
+
+    def test_test_serial_ports_lost(self, ve_isolated, serial_port_path, monkeypatch):
+        """Test test_serial_ports fails on a port raising errors while polled."""
+        ve_isolated._com = SerialConnection(serial_port=serial_port_path,
+                                            source_name="TestVedirectController"
+                                            )
+
+        # device lost, in_waiting raises OSError
+        def in_waiting_lost(ser):
+            raise OSError(5, "Input/output error")
+
+        monkeypatch.setattr(serial.Serial, "in_waiting", property(in_waiting_lost))
+        assert not ve_isolated.test_serial_ports([serial_port_path])
+        assert serial_port_path in ve_isolated._failed_ports
+        assert not ve_isolated._com.ser.is_open
+        monkeypatch.undo()
+
+    def test_search_serial_port(self, ve_isolated):
         """Test search_serial_port method."""
         try:
-            self.obj.init_serial_connection(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
+            ve_isolated.init_serial_connection(serial_port=SerialConnection.get_virtual_home_serial_port("vmodem255"),
                                             source_name="TestVedirectController"
                                             )
         except VedirectException:
             tst = False
             for i in range(20):
-                if self.obj.search_serial_port():
+                if ve_isolated.search_serial_port():
                     tst = True
                     print("serial port retrieved at %s" % i)
                     break
                 time.sleep(0.8)
             assert tst
 
-    def test_init_data_read(self):
+    def test_init_data_read(self, ve):
         """Test init_data_read method."""
-        self.obj.read_data_single()
-        assert Ut.is_dict(self.obj.dict, not_null=True)
-        self.obj.init_data_read()
-        assert not Ut.is_dict(self.obj.dict, not_null=True) and Ut.is_dict(self.obj.dict)
+        ve.read_data_single()
+        assert Ut.is_dict(ve.dict, not_null=True)
+        ve.init_data_read()
+        assert not Ut.is_dict(ve.dict, not_null=True) and Ut.is_dict(ve.dict)
 
-    def test_input_read(self):
+    def test_input_read(self, ve):
         """Test input_read method."""
         datas = [
             b'\r', b'\n', b'P', b'I', b'D', b'\t',
             b'O', b'x', b'0', b'3', b'\r',
         ]
         for x in datas:
-            self.obj.input_read(x)
-        assert Ut.is_dict(self.obj.dict, not_null=True) and self.obj.dict.get('PID') == "Ox03"
-        self.obj.init_data_read()
+            ve.input_read(x)
+        assert Ut.is_dict(ve.dict, not_null=True) and ve.dict.get('PID') == "Ox03"
+        ve.init_data_read()
         datas = [
             b'\r', b'\n', b'C', b'h', b'e', b'c', b'k', b's', b'u', b'm', b'\t',
             b'O', b'\r', b'\n', b'\t', 'helloWorld'
         ]
         with pytest.raises(InputReadException):
             for x in datas:
-                self.obj.input_read(x)
+                ve.input_read(x)
 
-    def test_read_data_single(self):
+    def test_read_data_single(self, ve):
         """Test read_data_single method."""
-        data = self.obj.read_data_single()
+        data = ve.read_data_single()
         assert Ut.is_dict(data, not_null=True)
 
-    def test_read_data_callback(self):
+    def test_read_data_callback_lost_connection(self, ve_isolated):
+        """Test read_data_callback method reconnects when serial connection is lost."""
+        packets = []
+
+        def lose_connection(packet):
+            """Close the serial port after the first packet, as if the device was lost."""
+            packets.append(packet)
+            if len(packets) == 1:
+                ve_isolated._pending.clear()
+                ve_isolated._com.ser.close()
+                with pytest.raises(serial.SerialException):
+                    ve_isolated.get_serial_packets()
+
+        assert ve_isolated.read_data_callback(callback_func=lose_connection,
+                                              timeout=20,
+                                              connection_timeout=60,
+                                              max_loops=2
+                                              )
+        assert ve_isolated.is_serial_ready()
+        assert len(packets) == 2
+        assert all(Ut.is_dict(packet, not_null=True) for packet in packets)
+
+    def test_read_data_callback(self, ve):
         """Test read_data_callback method."""
 
         def func_callback(data: dict or None):
             """Callback function."""
             assert Ut.is_dict(data, not_null=True)
 
-        self.obj.read_data_callback(callback_func=func_callback,
+        ve.read_data_callback(callback_func=func_callback,
                                     timeout=20,
                                     connection_timeout=3600,
                                     max_loops=1
                                     )
 
+        # blocks may be pending from previous read,
+        # so loop until no block is received in time.
         with pytest.raises(TimeoutException):
-            self.obj.read_data_callback(callback_func=func_callback,
+            ve.read_data_callback(callback_func=func_callback,
                                         timeout=0.1,
                                         connection_timeout=3600,
-                                        max_loops=1
+                                        max_loops=None
                                         )
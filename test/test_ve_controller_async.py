@@ -0,0 +1,70 @@
+"""AsyncVedirectController unittest class."""
+import asyncio
+import pytest
+from vedirect_m8.ve_controller_async import AsyncVedirectController
+from ve_utils.utype import UType as Ut
+from vedirect_m8.exceptions import TimeoutException
+
+
+@pytest.fixture
+def ve_async(serial_port_path, serial_test):
+    """Return an AsyncVedirectController instance."""
+    controller = AsyncVedirectController(
+        serial_port=serial_port_path,
+        baud=19200,
+        timeout=0,
+        serial_test=serial_test
+    )
+    yield controller
+    if controller.is_serial_ready():
+        controller._com.ser.close()
+
+
+class TestAsyncVedirectController:
+
+    @staticmethod
+    def test_wait_serial_data(ve_async):
+        """Test wait_serial_data method."""
+        assert asyncio.run(ve_async.wait_serial_data(timeout=2))
+
+    @staticmethod
+    def test_wait_serial_data_blocking(ve_async):
+        """Test _wait_serial_data_blocking method."""
+        assert ve_async._wait_serial_data_blocking(timeout=2)
+
+    @staticmethod
+    def test_get_serial_packets_async(ve_async):
+        """Test get_serial_packets_async method."""
+
+        async def read_packets() -> list:
+            """Return the first decoded blocks."""
+            for _ in range(50):
+                result = await ve_async.get_serial_packets_async(timeout=2)
+                if result:
+                    return result
+            return []
+
+        packets = asyncio.run(read_packets())
+        assert Ut.is_list(packets, not_null=True)
+        assert Ut.is_dict(packets[0], not_null=True)
+
+    @staticmethod
+    def test_read_data_callback_async(ve_async):
+        """Test read_data_callback_async method."""
+
+        def func_callback(data: dict or None):
+            """Callback function."""
+            assert Ut.is_dict(data, not_null=True)
+
+        assert asyncio.run(ve_async.read_data_callback_async(callback_func=func_callback,
+                                                             timeout=20,
+                                                             connection_timeout=3600,
+                                                             max_loops=1
+                                                             ))
+
+        with pytest.raises(TimeoutException):
+            asyncio.run(ve_async.read_data_callback_async(callback_func=func_callback,
+                                                          timeout=0.1,
+                                                          connection_timeout=3600,
+                                                          max_loops=1
+                                                          ))
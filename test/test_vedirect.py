@@ -1,5 +1,7 @@
 """Vedirect unittest class."""
+import time
 import pytest
+import serial
 from vedirect_m8.vedirect import Vedirect
 from vedirect_m8.serconnect import SerialConnection
 from ve_utils.utype import UType as Ut
@@ -126,12 +128,126 @@ class TestVedirect:
         with pytest.raises(InputReadException):
             for x in datas:
                 self.obj.input_read(x)
+        # non ascii bytes are replaced once the field is complete
+        self.obj.init_data_read()
+        for x in b'\r\nP\xffD\t0x203\r':
+            self.obj.input_read(bytes((x,)))
+        assert self.obj.dict == {'P\ufffdD': '0x203'}
+        assert self.obj.key == b'' and self.obj.value == b''
+
+    def test_input_read_bulk(self):
+        """Test input_read_bulk method."""
+        datas = b'\r\nPID\tOx03\r'
+        assert self.obj.input_read_bulk(datas) == []
+        assert Ut.is_dict(self.obj.dict, not_null=True) and self.obj.dict.get('PID') == "Ox03"
+        self.obj.init_data_read()
+        datas = b'\r\nPID\t0x203\r\nV\t12800\r\nChecksum\t'
+        datas += bytes(((256 - sum(datas) % 256) % 256,))
+        # a block split in two buffers
+        assert self.obj.input_read_bulk(datas[:10]) == []
+        assert self.obj.input_read_bulk(datas[10:]) == [{'PID': '0x203', 'V': '12800'}]
+        # NUL bytes are skipped, except as checksum byte
+        self.obj.init_data_read()
+        datas_nul = b'\r\nPID\t0x\x00203\r\nV\t10039\r\n\x00Checksum\t\x00'
+        assert self.obj.input_read_bulk(datas_nul) == [{'PID': '0x203', 'V': '10039'}]
+        # hex frames are skipped
+        self.obj.init_data_read()
+        assert self.obj.input_read_bulk(b':A4F1000C1\n' + datas) == [{'PID': '0x203', 'V': '12800'}]
+        # non ascii bytes are replaced, and the block fails the checksum
+        self.obj.init_data_read()
+        assert self.obj.input_read_bulk(b'\r\nPID\t\xff\r') == []
+        assert self.obj.dict.get('PID') == '\ufffd'
+        self.obj.init_data_read()
+        assert self.obj.input_read_bulk(datas.replace(b'12800', b'128\xff0')) == []
+
+    def test_input_read_frames(self):
+        """Test input_read_frames method."""
+        datas = b'\r\nPID\t0x203\r\nV\t12800\r\nChecksum\t'
+        datas += bytes(((256 - sum(datas) % 256) % 256,))
+        packets = []
+        # complete blocks are decoded, a partial block is left
+        assert self.obj.input_read_frames(datas * 2 + datas[:10], packets) == len(datas) * 2
+        assert packets == [{'PID': '0x203', 'V': '12800'}] * 2
+        assert self.obj.bytes_sum == 0
+        # malformed field and hex frame are left to the state machine
+        packets = []
+        assert self.obj.input_read_frames(datas.replace(b'V\t', b'V'), packets) == 0
+        assert self.obj.input_read_frames(b':A4F1000C1\n' + datas, packets) == 0
+        assert packets == []
+
+    def test_get_serial_packets(self, monkeypatch):
+        """Test get_serial_packets method."""
+        packets = []
+        for _ in range(50):
+            packets = self.obj.get_serial_packets()
+            if packets:
+                break
+        assert Ut.is_list(packets, not_null=True)
+
+        # device lost, in_waiting raises OSError
+        def in_waiting_lost(ser):
+            raise OSError(5, "Input/output error")
+
+        monkeypatch.setattr(type(self.obj._com.ser), "in_waiting", property(in_waiting_lost))
+        with pytest.raises(serial.SerialException):
+            self.obj.get_serial_packets()
+        monkeypatch.undo()
+
+        # port closed
+        self.obj._com.ser.close()
+        with pytest.raises(serial.SerialException):
+            self.obj.get_serial_packets()
+
+    def test_get_serial_packet(self):
+        """Test get_serial_packet method."""
+        packet = None
+        for _ in range(5000):
+            packet = self.obj.get_serial_packet()
+            if packet is not None:
+                break
+        assert Ut.is_dict(packet, not_null=True)
+        # the block is a copy, not the reader dictionary
+        assert packet is not self.obj.dict
+
+    def test_frames(self):
+        """Test frames method."""
+        frames = self.obj.frames(timeout=20)
+        first, second = next(frames), next(frames)
+        frames.close()
+        assert Ut.is_dict(first, not_null=True) and Ut.is_dict(second, not_null=True)
+        # each block is a new dictionary
+        assert first is not second and first is not self.obj.dict
+        # serial timeout is restored
+        assert self.obj._com.ser.timeout == self.obj._com._timeout
 
     def test_read_data_single(self):
         """Test read_data_single method."""
         data = self.obj.read_data_single()
         assert Ut.is_dict(data, not_null=True)
 
+    def test_read_data_single_backlog(self):
+        """Test read_data_single method does not drop decoded blocks."""
+        decoded, get_serial_packets = [], self.obj.get_serial_packets
+
+        def get_serial_packets_spy() -> list:
+            """Record decoded blocks."""
+            packets = get_serial_packets()
+            decoded.extend(packets)
+            return packets
+
+        self.obj.get_serial_packets = get_serial_packets_spy
+        # let some blocks queue on serial port
+        time.sleep(2)
+        returned = [self.obj.read_data_single(timeout=5)]
+        while self.obj._pending:
+            returned.append(self.obj.read_data_single(timeout=5))
+        assert len(decoded) > 1
+        assert returned == decoded
+        # pending blocks are dropped by init_data_read
+        self.obj._pending.append({'V': '12800'})
+        self.obj.init_data_read()
+        assert not self.obj._pending
+
     def test_read_data_callback(self):
         """Test read_data_callback method."""
 
@@ -144,10 +260,12 @@ class TestVedirect:
                                     max_loops=1
                                     )
 
+        # buffered bytes may complete a block at once,
+        # so loop until no block is received in time.
         with pytest.raises(TimeoutException):
             self.obj.read_data_callback(callback_function=func_callback,
                                         timeout=0.1,
-                                        max_loops=1
+                                        max_loops=None
                                         )
 
         with pytest.raises(VedirectException):
@@ -23,9 +23,19 @@ __license__ = "MIT"
 __status__ = "Production"
 __version__ = "2.0.0"
 
-logging.basicConfig()
 logger = logging.getLogger("vedirect")
 
+_VALID_BAUDS = frozenset((
+    110, 300, 600, 1200,
+    2400, 4800, 9600, 14400,
+    19200, 38400, 57600, 115200,
+    128000, 256000
+))
+
+# User home directory, resolved once at import
+_HOME_PATH = os.path.expanduser('~')
+_VIRTUAL_PORTS_PATHS = (_HOME_PATH,)
+
 
 class SerialConnection:
     """ 
@@ -185,7 +195,7 @@ class SerialConnection:
 
         :return: list of valid virtual serial ports paths
         """
-        return [os.path.expanduser('~')]
+        return list(_VIRTUAL_PORTS_PATHS)
 
     @staticmethod
     def get_virtual_home_serial_port(port: str) -> str or None:
@@ -201,7 +211,7 @@ class SerialConnection:
         """
         path = None
         if Ut.is_virtual_serial_port_pattern(port):
-            path = os.path.join(os.path.expanduser('~'), port)
+            path = os.path.join(_HOME_PATH, port)
         return path
 
     @staticmethod
@@ -221,7 +231,7 @@ class SerialConnection:
         """
         name, path = SerialConnection.split_serial_port(serial_port)
         return Ut.is_str(serial_port)\
-            and path in SerialConnection.get_virtual_ports_paths()\
+            and path in _VIRTUAL_PORTS_PATHS\
             and Ut.is_virtual_serial_port_pattern(name)
 
     @staticmethod
@@ -264,13 +274,7 @@ class SerialConnection:
         :param baud: The baudrate value to test.
         :return: True if the baudrate value is valid and is a integer instance.
         """
-        return Ut.is_int(baud)\
-            and baud in [
-               110, 300, 600, 1200,
-               2400, 4800, 9600, 14400,
-               19200, 38400, 57600, 115200,
-               128000, 256000
-           ]
+        return Ut.is_int(baud) and baud in _VALID_BAUDS
 
     @staticmethod
     def is_timeout(timeout: int or float) -> bool:
@@ -332,7 +336,7 @@ class SerialConnection:
                 and path is None or path == "")\
             or (USys.is_op_sys_type('unix')
                 and Ut.is_str(path)
-                and (path in SerialConnection.get_virtual_ports_paths()
+                and (path in _VIRTUAL_PORTS_PATHS
                      or path == "/dev"))
 
     def init_settings(self,
@@ -524,7 +528,7 @@ class SerialConnection:
         result = list()
         try:
             if USys.is_op_sys_type('unix'):
-                for path in SerialConnection.get_virtual_ports_paths():
+                for path in _VIRTUAL_PORTS_PATHS:
                     if path != "/dev" and os.path.exists(path):
                         # get list files from path
                         for entry in os.scandir(path):
@@ -16,7 +16,6 @@ __license__ = "MIT"
 __status__ = "Production"
 __version__ = "1.0.0"
 
-logging.basicConfig()
 logger = logging.getLogger("vedirect")
 
 
@@ -17,6 +17,17 @@ __license__ = "MIT"
 __status__ = "Production"
 __version__ = "1.0.0"
 
+_KEY_PATTERN = re.compile(
+    r"(?=\w{1,30}$)^([a-zA-Z\d]+(?:_[a-zA-Z\d]+)*)$"
+)
+_SERIAL_KEY_PATTERN = re.compile(
+    r"(?=[a-zA-Z\d_#]{1,30}$)^([a-zA-Z\d#]+(?:_[a-zA-Z\d#]+)*)$"
+)
+_VIRTUAL_SERIAL_PORT_PATTERN = re.compile(r'^(vmodem\d{1,3})$')
+_SERIAL_PORT_NAME_PATTERN = re.compile(r'^((?:tty(?:USB|ACM)|vmodem|COM)\d{1,3})$')
+_UNIX_SERIAL_PORT_PATTERN = re.compile(r'^(/dev/(tty(?:USB|ACM)\d{1,3}))$')
+_WIN_SERIAL_PORT_PATTERN = re.compile(r'^(COM\d{1,3})$')
+
 
 class SerialUtils (UType):
     """
@@ -30,61 +41,29 @@ class SerialUtils (UType):
     @staticmethod
     def is_key_pattern(data: str) -> bool:
         """Test if is valid key pattern."""
-        return SerialUtils.is_str(data)\
-            and SerialUtils.is_list(
-            re.compile(
-                r"(?=\w{1,30}$)^([a-zA-Z\d]+(?:_[a-zA-Z\d]+)*)$"
-                ).findall(data),
-            not_null=True
-        )
+        return SerialUtils.is_str(data) and _KEY_PATTERN.match(data) is not None
 
     @staticmethod
     def is_serial_key_pattern(data: str) -> bool:
         """Test if is valid key pattern."""
-        return SerialUtils.is_str(data)\
-            and SerialUtils.is_list(
-            re.compile(
-                r"(?=[a-zA-Z\d_#]{1,30}$)^([a-zA-Z\d#]+(?:_[a-zA-Z\d#]+)*)$"
-                ).findall(data),
-            not_null=True
-        )
+        return SerialUtils.is_str(data) and _SERIAL_KEY_PATTERN.match(data) is not None
 
     @staticmethod
     def is_virtual_serial_port_pattern(data: str) -> bool:
         """Test if is valid unix virtual serial port pattern."""
-        return SerialUtils.is_str(data) and SerialUtils.is_list(
-            re.compile(
-                r'^(vmodem\d{1,3})$'
-            ).findall(data),
-            not_null=True
-        )
+        return SerialUtils.is_str(data) and _VIRTUAL_SERIAL_PORT_PATTERN.match(data) is not None
 
     @staticmethod
     def is_serial_port_name_pattern(data: str) -> bool:
         """Test if is valid serial port name pattern."""
-        return SerialUtils.is_str(data) and SerialUtils.is_list(
-            re.compile(
-                r'^((?:tty(?:USB|ACM)|vmodem|COM)\d{1,3})$'
-            ).findall(data),
-            not_null=True
-        )
+        return SerialUtils.is_str(data) and _SERIAL_PORT_NAME_PATTERN.match(data) is not None
 
     @staticmethod
     def is_unix_serial_port_pattern(data: str) -> bool:
         """Test if is valid unix serial port pattern."""
-        return SerialUtils.is_str(data) and SerialUtils.is_list(
-            re.compile(
-                r'^(/dev/(tty(?:USB|ACM)\d{1,3}))$'
-                ).findall(data),
-            not_null=True
-        )
+        return SerialUtils.is_str(data) and _UNIX_SERIAL_PORT_PATTERN.match(data) is not None
 
     @staticmethod
     def is_win_serial_port_pattern(data: str) -> bool:
         """Test if is valid win serial port pattern."""
-        return SerialUtils.is_str(data) and SerialUtils.is_list(
-            re.compile(
-                r'^(COM\d{1,3})$'
-                ).findall(data),
-            not_null=True
-        )
+        return SerialUtils.is_str(data) and _WIN_SERIAL_PORT_PATTERN.match(data) is not None
@@ -29,7 +29,6 @@ __license__ = "MIT"
 __status__ = "Production"
 __version__ = "1.0.0"
 
-logging.basicConfig()
 logger = logging.getLogger("vedirect")
 
 
@@ -46,6 +45,9 @@ class VedirectController(Vedirect):
                  serial.SerialTimeoutException,
                  VedirectException
     """
+    # Time in seconds to skip a serial port after failing to test him
+    FAILED_PORTS_TTL = 30
+
     def __init__(self,
                  serial_test: dict,
                  serial_port: str or None = None,
@@ -68,6 +70,7 @@ class VedirectController(Vedirect):
         :param source_name: This is used in logger to identify the source of call.
         :return: Nothing
         """
+        self._failed_ports = dict()
         Vedirect.__init__(self,
                           serial_port=serial_port,
                           baud=baud,
@@ -170,7 +173,7 @@ class VedirectController(Vedirect):
             except Exception as ex:
                 logger.debug(
                     '[VeDirect] Unable to read serial data to test'
-                    'ex : %s' % ex
+                    'ex : %s', ex
                 )
         return res
 
@@ -184,6 +187,8 @@ class VedirectController(Vedirect):
         and reads data from it. It then passes this data into
         the SerialTestHelper class which runs some basic tests
         on the data returned by the serial connection.
+        Ports failing the test are skipped on next calls for FAILED_PORTS_TTL seconds,
+        unless all ports to test failed recently.
         :param self: Reference the class instance
         :param ports:list: Specify the serial ports to test
         :return: True if the serial port is open and
@@ -194,14 +199,34 @@ class VedirectController(Vedirect):
         """
         if self.is_ready_to_search_ports():
             if Ut.is_list(ports, not_null=True):
+                now = time.monotonic()
+                failed_since = now - self.FAILED_PORTS_TTL
+                ports = [
+                    port for port in ports
+                    if self._failed_ports.get(port, failed_since) <= failed_since
+                ] or ports
                 for port in ports:
                     if SerialConnection.is_serial_port(port):
 
                         if self._com.connect(**{"serial_port": port, 'timeout': 0}):
-                            time.sleep(0.5)
-                            data = self.read_data_to_test()
+                            # drop blocks and partial block read from previous port
+                            self.init_data_read()
+                            # wait for incoming data, at most 0.5s
+                            deadline = time.monotonic() + 0.5
+                            try:
+                                while self._serial_in_waiting() < 16 and time.monotonic() < deadline:
+                                    time.sleep(0.01)
+                                data = self.read_data_to_test()
+                            except serial.SerialException as ex:
+                                logger.debug(
+                                    '[VeDirect::test_serial_ports] '
+                                    'Unable to read serial port %s. '
+                                    'ex : %s', port, ex
+                                )
+                                data = None
                             if self._ser_test.run_serial_tests(data):
                                 self._com.ser.timeout = self._com._timeout
+                                self._failed_ports.clear()
                                 logger.info(
                                     "[VeDirect::test_serial_ports] "
                                     "New connection established to serial port %s. " %
@@ -210,6 +235,7 @@ class VedirectController(Vedirect):
                                 return True
                             else:
                                 self._com.ser.close()
+                        self._failed_ports[port] = time.monotonic()
 
                 return False
         else:
@@ -259,10 +285,11 @@ class VedirectController(Vedirect):
                 "Lost serial connection, attempting to reconnect. "
                 "reconnection timeout is set to %ss" % timeout
             )
-            bc, now, tim = True, time.time(), 0
-            while bc:
-                tim = time.time()
-                if self.search_serial_port():
+            search_serial_port, clock = self.search_serial_port, time.monotonic
+            now, tim, backoff = clock(), 0, 0.1
+            while True:
+                tim = clock()
+                if search_serial_port():
                     return True
 
                 if tim-now > timeout:
@@ -273,7 +300,8 @@ class VedirectController(Vedirect):
                         (timeout, exception)
                     )
 
-                time.sleep(2.5)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 2.5)
         raise VedirectException(
             "[VeDirect::wait_or_search_serial_connection] "
             "Unable to connect to any serial item. "
@@ -297,41 +325,59 @@ class VedirectController(Vedirect):
         :return: A dictionary
         :doc-author: Trelent
         """
-        bc, now, tim, i = True, time.time(), 0, 0
-        packet = None
+        get_serial_packets, clock, pending = self.get_serial_packets, time.monotonic, self._pending
+        now, tim, i = clock(), 0, 0
+        max_loops_val = max_loops if Ut.is_int(max_loops) else None
         if self.is_ready():
-            while bc:
-                tim = time.time()
-                try:
-                    packet = self.get_serial_packet()
-                except (
-                        InputReadException,
-                        serial.SerialException,
-                        serial.SerialTimeoutException
-                        ) as ex:
-                    if self.wait_or_search_serial_connection(ex, connection_timeout):
-                        now = tim = time.time()
-                        packet = self.get_serial_packet()
-
-                if packet is not None:
-                    logger.debug(
-                        "Serial reader success: "
-                        "packet: %s -- "
-                        "state: %s -- "
-                        "bytes_sum: %s " %
-                        (packet, self.state, self.bytes_sum)
-                    )
-                    callback_func(packet)
-                    now = tim
-                    i = i+1
-                    packet = None
-
-                # timeout serial read
-                Vedirect.is_timeout(tim - now, timeout)
-
-                if Ut.is_int(max_loops) and i >= max_loops:
-                    return True
-                time.sleep(0.1)
+            # block on serial read until data arrives instead of polling
+            read_timeout = min(timeout, 1.0)
+            self._com.ser.timeout = read_timeout
+            try:
+                while True:
+                    tim = clock()
+                    if not pending:
+                        try:
+                            pending.extend(get_serial_packets())
+                        except (
+                                InputReadException,
+                                serial.SerialException,
+                                serial.SerialTimeoutException
+                                ) as ex:
+                            if self.wait_or_search_serial_connection(ex, connection_timeout):
+                                self._com.ser.timeout = read_timeout
+                                now = tim = clock()
+                                pending.extend(get_serial_packets())
+
+                    # blocks not delivered on max_loops are kept for next calls
+                    while pending:
+                        packet = pending.popleft()
+                        logger.debug(
+                            "Serial reader success: "
+                            "packet: %s -- "
+                            "state: %s -- "
+                            "bytes_sum: %s ",
+                            packet, self.state, self.bytes_sum
+                        )
+                        callback_func(packet)
+                        now = tim
+                        i = i+1
+                        if max_loops_val is not None and i >= max_loops_val:
+                            return True
+
+                    # timeout serial read, raise only when elapsed
+                    if tim - now >= timeout:
+                        raise TimeoutException(
+                            '[VeDirect::read_data_callback] '
+                            'Unable to read serial data. '
+                            'Timeout error.'
+                        )
+
+                    # max_loops of zero or less return after the first read
+                    if max_loops_val is not None and i >= max_loops_val:
+                        return True
+            finally:
+                if self.is_serial_ready():
+                    self._com.ser.timeout = self._com._timeout
         else:
             logger.error(
                 '[VeDirect::read_data_callback] '
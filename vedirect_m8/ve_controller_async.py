@@ -0,0 +1,223 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Used to decode the Victron Energy VE.Direct text protocol in asyncio event loop.
+
+Extends VedirectController, and add ability to read serial data,
+and wait for serial connection without blocking the event loop.
+So many devices can be read from a single event loop thread.
+
+ .. seealso:: VedirectController
+ .. raises:: InputReadException,
+             serial.SerialException,
+             serial.SerialTimeoutException,
+             VedirectException
+"""
+import asyncio
+import logging
+import time
+import serial
+
+from ve_utils.utype import UType as Ut
+from vedirect_m8.ve_controller import VedirectController
+from vedirect_m8.exceptions import InputReadException, TimeoutException, VedirectException
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2020, Eli Serra"
+__deprecated__ = False
+__license__ = "MIT"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+# asyncio.get_running_loop is new in python 3.7,
+# on older versions get_event_loop returns the running loop from coroutines.
+_get_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+logger = logging.getLogger("vedirect")
+
+
+class AsyncVedirectController(VedirectController):
+    """
+    Used to decode the Victron Energy VE.Direct text protocol in asyncio event loop.
+
+    Extends VedirectController, and add ability to read serial data,
+    and wait for serial connection without blocking the event loop.
+
+    On unix systems, the event loop is notified when serial data is available,
+    on other systems the serial read is executed in the default loop executor.
+
+     .. seealso:: VedirectController
+     .. raises:: InputReadException,
+                 serial.SerialException,
+                 serial.SerialTimeoutException,
+                 VedirectException
+    """
+
+    async def wait_serial_data(self, timeout: int or float = 1) -> bool:
+        """
+        Wait until serial data is available to read, without blocking the event loop.
+
+        :param self: Reference the class instance
+        :param timeout: Max time to wait in seconds
+        :return: True if serial data is available to read.
+        """
+        loop = _get_running_loop()
+        if self._serial_in_waiting():
+            return True
+        try:
+            fd = self._com.ser.fileno()
+            future = loop.create_future()
+            loop.add_reader(fd, lambda: future.done() or future.set_result(True))
+        except (AttributeError, OSError, NotImplementedError):
+            # no file descriptor or event loop without readers support (win32)
+            return await loop.run_in_executor(None, self._wait_serial_data_blocking, timeout)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(fd)
+
+    def _wait_serial_data_blocking(self, timeout: int or float) -> bool:
+        """Wait until serial data is available to read, polling serial in_waiting."""
+        deadline = time.monotonic() + timeout
+        while not self._serial_in_waiting():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    async def get_serial_packets_async(self, timeout: int or float = 1) -> list:
+        """
+        Return Ve Direct block packets from serial reader, without blocking the event loop.
+
+        :param self: Reference the class instance
+        :param timeout: Max time to wait serial data in seconds
+        :return: A list of vedirect block data, empty if no block entirely decoded.
+        """
+        if self._pending or await self.wait_serial_data(timeout):
+            return self.get_serial_packets()
+        return []
+
+    async def search_serial_port_async(self) -> bool:
+        """Search the serial port from serial tests, in the default loop executor."""
+        loop = _get_running_loop()
+        return await loop.run_in_executor(None, self.search_serial_port)
+
+    async def wait_or_search_serial_connection_async(self,
+                                                     exception: Exception or None = None,
+                                                     timeout: int or float = 18400
+                                                     ) -> bool:
+        """
+        Wait or search for a new serial connection, without blocking the event loop.
+
+        Same as wait_or_search_serial_connection,
+        but ports are searched in the default loop executor,
+        and the event loop is free while waiting between two searches.
+        :param self: Reference the class instance
+        :param exception: Pass an exception to the function
+        :param timeout: Set the timeout of the function
+        :return: True if the serial connection was successful
+
+        .. raises:: TimeoutException, VedirectException
+        """
+        if self.is_ready_to_search_ports():
+            logger.info(
+                "[VeDirect::wait_or_search_serial_connection_async] "
+                "Lost serial connection, attempting to reconnect. "
+                "reconnection timeout is set to %ss" % timeout
+            )
+            clock = time.monotonic
+            now, backoff = clock(), 0.1
+            while True:
+                tim = clock()
+                if await self.search_serial_port_async():
+                    return True
+
+                if tim - now > timeout:
+                    raise TimeoutException(
+                        "[VeDirect::wait_or_search_serial_connection_async] "
+                        "Unable to connect to any serial item. "
+                        "Timeout error : %s. Exception : %s" %
+                        (timeout, exception)
+                    )
+
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 2.5)
+        raise VedirectException(
+            "[VeDirect::wait_or_search_serial_connection_async] "
+            "Unable to connect to any serial item. "
+            "Exception : %s" % exception
+        )
+
+    async def read_data_callback_async(self,
+                                       callback_func,
+                                       timeout: int = 60,
+                                       connection_timeout: int = 3600,
+                                       max_loops: int or None = None
+                                       ) -> bool or None:
+        """
+        Read data from the serial port and returns it to a callback function.
+
+        Same as read_data_callback, without blocking the event loop.
+        :param self: Reference the class instance
+        :param callback_func:function: Pass a function to the read_data_callback_async function
+        :param timeout:int=60: Set the timeout for the read_data_callback_async function
+        :param connection_timeout:int=3600: Set the timeout for the connection
+        :param max_loops:int or None=None: Limit the number of loops
+        :return: True if max_loops is reached.
+
+        .. raises:: TimeoutException, VedirectException
+        """
+        clock, pending = time.monotonic, self._pending
+        now, i = clock(), 0
+        max_loops_val = max_loops if Ut.is_int(max_loops) else None
+        if self.is_ready():
+            wait_timeout = min(timeout, 1.0)
+            while True:
+                tim = clock()
+                if not pending:
+                    try:
+                        pending.extend(await self.get_serial_packets_async(wait_timeout))
+                    except (
+                            InputReadException,
+                            serial.SerialException,
+                            serial.SerialTimeoutException
+                            ) as ex:
+                        if await self.wait_or_search_serial_connection_async(ex, connection_timeout):
+                            now = tim = clock()
+
+                # blocks not delivered on max_loops are kept for next calls
+                while pending:
+                    packet = pending.popleft()
+                    logger.debug(
+                        "Serial reader success: "
+                        "packet: %s -- "
+                        "state: %s -- "
+                        "bytes_sum: %s ",
+                        packet, self.state, self.bytes_sum
+                    )
+                    callback_func(packet)
+                    now = tim
+                    i = i+1
+                    if max_loops_val is not None and i >= max_loops_val:
+                        return True
+
+                # timeout serial read, raise only when elapsed
+                if tim - now >= timeout:
+                    raise TimeoutException(
+                        '[VeDirect::read_data_callback_async] '
+                        'Unable to read serial data. '
+                        'Timeout error.'
+                    )
+
+                # max_loops of zero or less return after the first read
+                if max_loops_val is not None and i >= max_loops_val:
+                    return True
+        else:
+            logger.error(
+                '[VeDirect::read_data_callback_async] '
+                'Unable to read serial data. '
+                'Not connected to serial port...')
+
+        callback_func(None)
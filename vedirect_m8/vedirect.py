@@ -10,6 +10,8 @@ This is a forked version of script originally created by Janne Kario.
 """
 import logging
 import time
+from collections import deque
+import serial
 from vedirect_m8.serconnect import SerialConnection
 from vedirect_m8.exceptions import SettingInvalidException, InputReadException, TimeoutException, VedirectException
 
@@ -20,9 +22,11 @@ __license__ = "MIT"
 __status__ = "Production"
 __version__ = "1.0.0"
 
-logging.basicConfig()
 logger = logging.getLogger("vedirect")
 
+# Marker preceding the checksum byte of a block.
+_CHECKSUM_MARKER = b'\r\nChecksum\t'
+
 
 class Vedirect:
     """
@@ -60,11 +64,13 @@ class Vedirect:
         self.header2 = ord('\n')
         self.hexmarker = ord(':')
         self.delimiter = ord('\t')
-        self.key = ''
-        self.value = ''
+        self.key = bytearray()
+        self.value = bytearray()
         self.bytes_sum = 0
         self.state = self.WAIT_HEADER
         self.dict = {}
+        # decoded blocks not yet delivered
+        self._pending = deque()
         self.init_settings(serial_port=serial_port,
                            baud=baud,
                            timeout=timeout,
@@ -78,25 +84,30 @@ class Vedirect:
         """
         Test if obj is valid SerialConnection instance.
 
+        Test the exact type first, and fall back to isinstance for subclasses.
         :Example :
             - >Vedirect.is_serial_com(obj=my_object)
             - >True
         :param obj: The object to test.
         :return: True if obj is valid SerialConnection instance.
         """
-        return isinstance(obj, SerialConnection)
+        return type(obj) is SerialConnection or isinstance(obj, SerialConnection)
 
     @staticmethod
     def is_timeout(elapsed: float or int, timeout: float or int = 60) -> bool:
         """
         Test if elapsed time is greater than timeout.
 
+        Elapsed time must be measured with time.monotonic(),
+        to not be affected by system clock updates.
+        Raise TimeoutException if elapsed time is greater or equal to timeout.
         :Example :
             - >Vedirect.is_timeout(elapsed=45, timeout=60)
             - >True
-        :param elapsed: The elapsed time to test,
-        :param timeout: The timeout to evaluate.
-        :return: True if elapsed time is upper than timeout.
+        :param elapsed: The elapsed time to test, in seconds,
+        :param timeout: The timeout to evaluate, in seconds.
+        :return: True if elapsed time is lower than timeout.
+        .. raises:: TimeoutException
         """
         if elapsed >= timeout:
             raise TimeoutException(
@@ -243,78 +254,214 @@ class Vedirect:
 
     def init_data_read(self):
         """ Initialise reader properties """
-        self.key = ''
-        self.value = ''
+        self.key = bytearray()
+        self.value = bytearray()
         self.bytes_sum = 0
         self.state = self.WAIT_HEADER
         self.dict = {}
+        self._pending.clear()
 
     def input_read(self, byte) -> dict or None:
-        """Input read from byte."""
+        """
+        Input read from byte.
+
+        The byte is decoded with input_read_bulk.
+        :return: A new dictionary of vedirect block data if the byte completes a valid block, else None.
+        """
         try:
-            nbyte = ord(byte)
-            if byte == self.hexmarker and self.state != self.IN_CHECKSUM:
-                self.state = self.HEX
-            if self.state == self.WAIT_HEADER:
-                self.bytes_sum += nbyte
-                if nbyte == self.header1:
-                    self.state = self.WAIT_HEADER
-                elif nbyte == self.header2:
-                    self.state = self.IN_KEY
-                return None
-            elif self.state == self.IN_KEY:
-                self.bytes_sum += nbyte
-                if nbyte == self.delimiter:
-                    if self.key == 'Checksum':
-                        self.state = self.IN_CHECKSUM
-                    else:
-                        self.state = self.IN_VALUE
-                else:
-                    self.key += byte.decode('ascii')
-                return None
-            elif self.state == self.IN_VALUE:
-                self.bytes_sum += nbyte
-                if nbyte == self.header1:
-                    self.state = self.WAIT_HEADER
-                    self.dict[self.key] = self.value
-                    self.key = ''
-                    self.value = ''
-                else:
-                    self.value += byte.decode('ascii')
-                return None
-            elif self.state == self.IN_CHECKSUM:
-                self.bytes_sum += nbyte
-                self.key = ''
-                self.value = ''
-                self.state = self.WAIT_HEADER
-                if self.bytes_sum % 256 == 0:
-                    self.bytes_sum = 0
-                    return self.dict
+            buf = bytes((ord(byte),))
+        except (TypeError, ValueError) as ex:
+            raise InputReadException(
+                "[Vedirect::input_read] "
+                "Serial input read error %s " % ex
+            )
+        packets = self.input_read_bulk(buf)
+        return packets[0] if packets else None
+
+    def input_read_frames(self, buf: bytes, packets: list) -> int:
+        """
+        Input read of complete blocks from bytes buffer start.
+
+        Blocks are located by their checksum field and decoded at once,
+        with the same result as the transitions table state machine.
+        Stops at the first block with a hex frame, a NUL byte,
+        or a malformed field, left to the state machine.
+        Reader must wait a header, with no key or value being read.
+        :param buf: The bytes buffer to decode.
+        :param packets: The list where valid blocks are added.
+        :return: The buffer position following the last decoded block.
+        """
+        data, bytes_sum = self.dict, self.bytes_sum
+        pos, size, find = 0, len(buf), buf.find
+        marker, marker_size = _CHECKSUM_MARKER, len(_CHECKSUM_MARKER)
+        while True:
+            end = find(marker, pos)
+            if end < 0 or end + marker_size >= size:
+                break
+            head = buf[pos:end]
+            start = head.find(b'\n') + 1
+            if not start or b':' in head or b'\x00' in head:
+                break
+            fields = _split_fields(head[start:])
+            if fields is None:
+                break
+            data.update(fields)
+            # block bytes up to checksum byte
+            checksum_end = end + marker_size + 1
+            if (bytes_sum + sum(buf[pos:checksum_end])) % 256 == 0:
+                packets.append(dict(data))
+            bytes_sum, pos = 0, checksum_end
+        self.bytes_sum = bytes_sum
+        return pos
+
+    def input_read_bulk(self, buf: bytes) -> list:
+        """
+        Input read from bytes buffer.
+
+        Complete blocks are decoded at once with input_read_frames if possible,
+        remaining bytes with the state machine of the module transitions table,
+        keeping reader properties in local variables while looping.
+        :param buf: The bytes buffer to decode.
+        :return: A list of vedirect block data decoded from buffer.
+        """
+        packets = []
+        if self.state == self.WAIT_HEADER and not self.key and not self.value:
+            pos = self.input_read_frames(buf, packets)
+            if pos:
+                buf = buf[pos:]
+        transitions, in_checksum = _TRANSITIONS, self.IN_CHECKSUM
+        state, bytes_sum, data = self.state, self.bytes_sum, self.dict
+        key, value = self.key, self.value
+        try:
+            for nbyte in buf:
+                action, state = transitions[state][nbyte]
+                if action == _A_VALUE:
+                    bytes_sum += nbyte
+                    value.append(nbyte)
+                elif action == _A_KEY:
+                    bytes_sum += nbyte
+                    key.append(nbyte)
+                elif action == _A_SUM:
+                    bytes_sum += nbyte
+                elif action == _A_FIELD:
+                    bytes_sum += nbyte
+                    data[key.decode('ascii', 'replace')] = value.decode('ascii', 'replace')
+                    key.clear()
+                    value.clear()
+                elif action == _A_KEY_END:
+                    bytes_sum += nbyte
+                    if key == b'Checksum':
+                        state = in_checksum
+                elif action == _A_CHECKSUM:
+                    key.clear()
+                    value.clear()
+                    if (bytes_sum + nbyte) % 256 == 0:
+                        packets.append(dict(data))
+                    bytes_sum = 0
                 else:
-                    self.bytes_sum = 0
-            elif self.state == self.HEX:
-                self.bytes_sum = 0
-                if nbyte == self.header2:
-                    self.state = self.WAIT_HEADER
-            else:
-                raise AssertionError()
+                    bytes_sum = 0
         except Exception as ex:
+            # drop the field being decoded
+            key.clear()
+            value.clear()
             raise InputReadException(
-                "[Vedirect::input_read] "
+                "[Vedirect::input_read_bulk] "
                 "Serial input read error %s " % ex
             )
+        finally:
+            self.state, self.bytes_sum = state, bytes_sum
+        return packets
 
     def get_serial_packet(self) -> dict or None:
         """
         Return Ve Direct block packet from serial reader.
 
-        Read a byte from serial and decode him with vedirect protocol.
+        Return the first decoded block not yet delivered,
+        else read and decode serial data with get_serial_packets.
+        Other decoded blocks are kept for next calls.
         :return: A dictionary of vedirect block data or None if block not entirely decoded.
         """
-        byte = self._com.ser.read(1)
-        if byte == b'\x00':
-            byte = self._com.ser.read(1)
-        return self.input_read(byte)
+        pending = self._pending
+        if not pending:
+            pending.extend(self.get_serial_packets())
+        return pending.popleft() if pending else None
+
+    def _serial_in_waiting(self) -> int:
+        """
+        Return the number of bytes waiting on serial.
+
+        pyserial does not wrap in_waiting errors,
+        so TypeError (port closed) or OSError (device lost)
+        are raised as serial exceptions.
+        :return: The number of bytes waiting on serial.
+        .. raises:: serial.SerialException
+        """
+        ser = self._com.ser
+        if not ser.is_open:
+            raise serial.PortNotOpenError()
+        try:
+            return ser.in_waiting
+        except (OSError, TypeError) as ex:
+            raise serial.SerialException(
+                "[Vedirect::_serial_in_waiting] "
+                "Unable to read serial port: %s" % ex
+            )
+
+    def get_serial_packets(self) -> list:
+        """
+        Return Ve Direct block packets from serial reader.
+
+        Return decoded blocks not yet delivered if any, without reading serial.
+        Else read all bytes waiting on serial (at least one),
+        and decode them with vedirect protocol.
+        :return: A list of vedirect block data, empty if no block entirely decoded.
+        """
+        if self._pending:
+            packets = list(self._pending)
+            self._pending.clear()
+            return packets
+        return self.input_read_bulk(self._com.ser.read(self._serial_in_waiting() or 1))
+
+    def frames(self, timeout: int or float = 60):
+        """
+        Yield Ve Direct block packets decoded from serial reader.
+
+        Each block is yielded as a new dictionary, not referenced by the reader.
+        Decoded blocks not yet yielded when the generator is closed
+        are kept, and yielded first on next iteration.
+        While iterating, serial reads wait until data arrives,
+        the serial timeout is restored when the generator is closed.
+        :Example :
+            - > for packet in ve.frames(timeout=3):
+            - >     print(packet)
+        :param self: Reference the class instance
+        :param timeout: Max time to wait between two blocks, in seconds
+        :return: A generator of vedirect block data.
+        .. raises:: TimeoutException
+        """
+        get_serial_packets, clock, pending = self.get_serial_packets, time.monotonic, self._pending
+        now = clock()
+        # block on serial read until data arrives instead of polling
+        self._com.ser.timeout = min(timeout, 1.0)
+        try:
+            while True:
+                tim = clock()
+                if not pending:
+                    pending.extend(get_serial_packets())
+                while pending:
+                    yield pending.popleft()
+                    now = tim
+
+                # timeout serial read, raise only when elapsed
+                if tim - now >= timeout:
+                    raise TimeoutException(
+                        '[VeDirect::frames] '
+                        'Unable to read serial data. '
+                        'Timeout error.'
+                    )
+        finally:
+            if self.is_serial_ready():
+                self._com.ser.timeout = self._com._timeout
 
     def read_data_single(self, timeout: int = 60) -> dict or None:
         """
@@ -330,20 +477,14 @@ class Vedirect:
         :return: A dictionary of the data
         :doc-author: Trelent
         """
-        bc, now, tim = True, time.time(), 0
-
         if self.is_ready():
-            while bc:
-                packet, tim = None, time.time()
-
-                packet = self.get_serial_packet()
-
-                if packet is not None:
-                    logger.debug("Serial reader success: dict: %s" % self.dict)
-                    return packet
-
-                # timeout serial read
-                Vedirect.is_timeout(tim-now, timeout)
+            frames = self.frames(timeout)
+            try:
+                packet = next(frames)
+            finally:
+                frames.close()
+            logger.debug("Serial reader success: dict: %s", packet)
+            return packet
         else:
             logger.error('[VeDirect] Unable to read serial data. Not connected to serial port...')
 
@@ -357,36 +498,102 @@ class Vedirect:
         """
         Read data from the serial port and returns it to a callback function.
 
+        Serial reads wait with the GIL released,
+        so instances reading distinct devices can run in parallel threads.
+        An instance must not be shared between threads.
         :param self: Reference the class instance
         :param callback_function:function: Pass a function to the read_data_callback function
         :param timeout:int=60: Set the timeout for the read_data_callback function
         :param max_loops:int or None=None: Limit the number of loops
         """
-        bc, now, tim, i = True, time.time(), 0, 0
-        packet = None
+        i = 0
+        max_loops_val = max_loops if isinstance(max_loops, int) and max_loops > 0 else None
         if self.is_ready():
-            while bc:
-                tim = time.time()
-
-                packet = self.get_serial_packet()
-
-                if packet is not None:
+            frames = self.frames(timeout)
+            try:
+                for packet in frames:
                     logger.debug(
                         "Serial reader success: packet: %s "
-                        "-- state: %s -- bytes_sum: %s " %
-                        (packet, self.state, self.bytes_sum))
+                        "-- state: %s -- bytes_sum: %s ",
+                        packet, self.state, self.bytes_sum)
                     callback_function(packet)
-                    now = tim
                     i = i + 1
-                    packet = None
-
-                # timeout serial read
-                Vedirect.is_timeout(tim-now, timeout)
-                if isinstance(max_loops, int) and 0 < max_loops <= i:
-                    return True
-                time.sleep(0.1)
+                    if max_loops_val is not None and i >= max_loops_val:
+                        return True
+            finally:
+                frames.close()
         else:
             raise VedirectException(
                 '[VeDirect::read_data_callback] '
                 'Unable to read serial data. '
                 'Not connected to serial port...')
+
+
+# Actions of the input_read_bulk transitions table.
+(_A_SUM, _A_KEY, _A_KEY_END, _A_VALUE, _A_FIELD, _A_CHECKSUM, _A_HEX) = range(7)
+
+
+def _build_transitions() -> tuple:
+    """
+    Build the transitions table of the Vedirect state machine.
+
+    The table is indexed by state then by byte value,
+    and gives an (action, next state) tuple.
+    NUL bytes are skipped, out of checksum byte.
+    From IN_KEY, the delimiter goes to IN_VALUE,
+    input_read_bulk switches to IN_CHECKSUM if the key is 'Checksum'.
+    :return: The transitions table.
+    """
+    header1, header2, hexmarker, delimiter = ord('\r'), ord('\n'), ord(':'), ord('\t')
+    transitions = []
+    for state in range(5):
+        row = []
+        for nbyte in range(256):
+            if nbyte == hexmarker and state != Vedirect.IN_CHECKSUM:
+                state_in = Vedirect.HEX
+            else:
+                state_in = state
+            if state_in == Vedirect.WAIT_HEADER:
+                next_state = Vedirect.IN_KEY if nbyte == header2 else state_in
+                action = _A_SUM
+            elif state_in == Vedirect.IN_KEY:
+                if nbyte == delimiter:
+                    next_state, action = Vedirect.IN_VALUE, _A_KEY_END
+                else:
+                    next_state, action = state_in, _A_KEY
+            elif state_in == Vedirect.IN_VALUE:
+                if nbyte == header1:
+                    next_state, action = Vedirect.WAIT_HEADER, _A_FIELD
+                else:
+                    next_state, action = state_in, _A_VALUE
+            elif state_in == Vedirect.IN_CHECKSUM:
+                # the checksum byte may be NUL
+                next_state, action = Vedirect.WAIT_HEADER, _A_CHECKSUM
+            else:
+                next_state = Vedirect.WAIT_HEADER if nbyte == header2 else state_in
+                action = _A_HEX
+            if nbyte == 0 and state_in != Vedirect.IN_CHECKSUM:
+                # skip NUL bytes, spurious serial artefacts
+                next_state, action = state_in, _A_SUM
+            row.append((action, next_state))
+        transitions.append(tuple(row))
+    return tuple(transitions)
+
+
+_TRANSITIONS = _build_transitions()
+
+
+def _split_fields(fields: bytes) -> list or None:
+    """
+    Split block fields from bytes, as decoded by the Vedirect state machine.
+
+    :param fields: The block fields bytes, between first key and last value.
+    :return: A list of (key, value) tuples, or None if a field is malformed.
+    """
+    result = []
+    for line in fields.decode('ascii', 'replace').split('\r\n'):
+        key, sep, value = line.partition('\t')
+        if not sep or key == 'Checksum' or '\r' in line or '\n' in line:
+            return None
+        result.append((key, value))
+    return result
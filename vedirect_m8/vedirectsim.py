@@ -23,7 +23,6 @@ __license__ = "MIT"
 __status__ = "Production"
 __version__ = "1.0.0"
 
-logging.basicConfig()
 logger = logging.getLogger("vedirect")
 
 
@@ -185,8 +184,8 @@ class Vedirectsim:
             self.ser.write(bytes(packet))
             self.block_counter += 1
             logger.debug(
-                "Sending packet %s on serial : %s. \n" %
-                (self.block_counter, self.dict)
+                "Sending packet %s on serial : %s. \n",
+                self.block_counter, self.dict
             )
         except serial.SerialTimeoutException as ex:
             logger.error(